@@ -1,8 +1,17 @@
 from mcp.server.fastmcp import FastMCP
 from typing import List, Dict, Any, Optional, Tuple
 from uv_mcp.uv_wrapper import UVWrapper
+import asyncio
 import os
 
+# Use uvloop's libuv event loop when available (not on Windows) for faster
+# stdio/socket handling in the MCP transport
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Get venv path from environment variable if set by CLI
 venv_path = os.environ.get("UV_MCP_VENV_PATH")
 
@@ -12,115 +21,152 @@ uv_wrapper = UVWrapper(venv_path)
 # Create uv-mcp server with dependencies
 mcp = FastMCP("uv-mcp", dependencies=["uv"])
 
+# Resources and tools are async and dispatch the blocking subprocess work
+# to a worker thread, so concurrent MCP requests overlap instead of
+# serializing on the event loop.
+
 # Resources
 @mcp.resource("python:packages://installed", name="Installed Python Packages", mime_type="application/json")
-def get_installed_packages() -> List[Dict[str, Any]]:
+async def get_installed_packages() -> str:
     """List of all installed packages and versions"""
     try:
-        packages = uv_wrapper.list_installed_packages()
-        return packages
+        # uv's JSON passes through verbatim; FastMCP serves str results
+        # as-is, so nothing is decoded and re-encoded on this path
+        return await asyncio.to_thread(uv_wrapper.list_installed_packages_json)
     except Exception as e:
         return f"Error retrieving installed packages: {str(e)}"
 
 @mcp.resource("python:packages://outdated", name="Outdated Python Packages", mime_type="application/json")
-def get_outdated_packages() -> List[Dict[str, Any]]:
+async def get_outdated_packages() -> str:
     """List of installed packages with newer versions available"""
     try:
-        outdated = uv_wrapper.get_outdated_packages()
-        return outdated
+        return await asyncio.to_thread(uv_wrapper.get_outdated_packages_json)
     except Exception as e:
         return f"Error retrieving outdated packages: {str(e)}"
 
 @mcp.resource("python:packages://{package_name}/info", name="Python Package Information", mime_type="application/json")
-def get_package_info_resource(package_name: str) -> Dict[str, Any]:
+async def get_package_info_resource(package_name: str) -> Dict[str, Any]:
     """Detailed information about a specific package"""
     try:
-        info = uv_wrapper.get_package_info(package_name)
-        return info
+        return await asyncio.to_thread(uv_wrapper.get_package_info, package_name)
     except Exception as e:
         return f"Error retrieving info for {package_name}: {str(e)}"
 
+@mcp.resource("python:requirements://{file_path}", name="Python Requirements File", mime_type="application/json")
+async def get_requirements_info(file_path: str) -> List[Dict[str, str]]:
+    """Parsed content of requirements files"""
+    try:
+        return await asyncio.to_thread(uv_wrapper.parse_requirements, file_path)
+    except Exception as e:
+        return f"Error parsing requirements file {file_path}: {str(e)}"
+
 # Tools
 @mcp.tool("run")
-def run_command(command: List[str]) -> str:
+async def run_command(command: List[str]) -> str:
     """Run a command or script"""
     try:
-        return uv_wrapper.run_uv_command(["run"] + command)
+        return await asyncio.to_thread(uv_wrapper.run_uv_command, ["run"] + command)
     except Exception as e:
         return f"Error running command: {str(e)}"
 
 @mcp.tool("init")
-def init_project() -> str:
+async def init_project() -> str:
     """Create a new project"""
     try:
-        return uv_wrapper.run_uv_command(["init"])
+        return await asyncio.to_thread(uv_wrapper.run_uv_command, ["init"])
     except Exception as e:
         return f"Error initializing project: {str(e)}"
 
 @mcp.tool("add")
-def add_dependency(package_name: str, version: Optional[str] = None) -> str:
+async def add_dependency(package_name: str, version: Optional[str] = None) -> str:
     """Add dependencies to the project"""
     try:
-        return uv_wrapper.add_dependency(package_name, version)
+        return await asyncio.to_thread(uv_wrapper.add_dependency, package_name, version)
     except Exception as e:
         return f"Error adding dependency {package_name}: {str(e)}"
 
 @mcp.tool("remove")
-def remove_dependency(package_name: str) -> str:
+async def remove_dependency(package_name: str) -> str:
     """Remove dependencies from the project"""
     try:
-        return uv_wrapper.remove_dependency(package_name)
+        return await asyncio.to_thread(uv_wrapper.remove_dependency, package_name)
     except Exception as e:
         return f"Error removing dependency {package_name}: {str(e)}"
 
 @mcp.tool("sync")
-def sync_dependencies(dry_run: bool = False) -> str:
+async def sync_dependencies(dry_run: bool = False) -> str:
     """Install all declared dependencies, uninstall anything not declared"""
     try:
         command = ["sync"]
         if dry_run:
             command.append("--dry-run")
-        return uv_wrapper.run_uv_command(command)
+        return await asyncio.to_thread(uv_wrapper.run_uv_command, command)
     except Exception as e:
         return f"Error syncing dependencies: {str(e)}"
 
 @mcp.tool("lock")
-def lock_dependencies() -> str:
+async def lock_dependencies() -> str:
     """Update the project's lockfile"""
     try:
-        return uv_wrapper.run_uv_command(["lock"])
+        return await asyncio.to_thread(uv_wrapper.run_uv_command, ["lock"])
     except Exception as e:
         return f"Error locking dependencies: {str(e)}"
 
 @mcp.tool("pip")
-def pip_command(command: List[str]) -> str:
+async def pip_command(command: List[str]) -> str:
     """Run a pip command"""
     try:
-        pip_cmd = ["pip"] + command
-        return uv_wrapper.run_uv_command(pip_cmd)
+        return await asyncio.to_thread(uv_wrapper.run_uv_command, ["pip"] + command)
     except Exception as e:
         return f"Error running pip command: {str(e)}"
 
 @mcp.tool("pip_install")
-def pip_install(package_name: str, version: Optional[str] = None) -> str:
+async def pip_install(package_name: str, version: Optional[str] = None) -> str:
     """Install a package using pip"""
     try:
-        return uv_wrapper.install_package(package_name, version)
+        return await asyncio.to_thread(uv_wrapper.install_package, package_name, version)
     except Exception as e:
         return f"Error installing {package_name}: {str(e)}"
 
 @mcp.tool("pip_uninstall")
-def pip_uninstall(package_name: str) -> str:
+async def pip_uninstall(package_name: str) -> str:
     """Uninstall a package using pip"""
     try:
-        return uv_wrapper.uninstall_package(package_name)
+        return await asyncio.to_thread(uv_wrapper.uninstall_package, package_name)
     except Exception as e:
         return f"Error uninstalling {package_name}: {str(e)}"
 
+@mcp.tool("check_package_installed")
+async def check_package_installed(package_name: str) -> str:
+    """Check if a specific package is installed"""
+    try:
+        installed, version = await asyncio.to_thread(uv_wrapper.check_package_installed, package_name)
+        if installed:
+            return f"{package_name} {version} is installed"
+        return f"{package_name} is not installed"
+    except Exception as e:
+        return f"Error checking {package_name}: {str(e)}"
+
+@mcp.tool("create_virtualenv")
+async def create_virtualenv(path: str, packages: Optional[List[str]] = None) -> str:
+    """Create a new virtual environment, optionally installing packages"""
+    try:
+        return await asyncio.to_thread(uv_wrapper.create_virtualenv, path, packages)
+    except Exception as e:
+        return f"Error creating virtual environment at {path}: {str(e)}"
+
+@mcp.tool("compare_environments")
+async def compare_environments(env1_path: str, env2_path: str) -> Dict[str, Any]:
+    """Compare installed packages between two virtual environments"""
+    try:
+        return await asyncio.to_thread(uv_wrapper.compare_environments, env1_path, env2_path)
+    except Exception as e:
+        return f"Error comparing environments: {str(e)}"
+
 @mcp.tool("pip_list")
-def pip_list() -> List[Dict[str, Any]]:
+async def pip_list() -> List[Dict[str, Any]]:
     """List all installed packages using pip"""
     try:
-        return uv_wrapper.list_installed_packages()
+        return await asyncio.to_thread(uv_wrapper.list_installed_packages)
     except Exception as e:
-        return f"Error listing packages: {str(e)}"
\ No newline at end of file
+        return f"Error listing packages: {str(e)}"
@@ -1,12 +1,28 @@
+import functools
+import importlib.metadata
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import sys
+import time
 import uv
 from typing import List, Dict, Any, Optional, Tuple, Union
+import re
 import shlex
 import pathlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when installed, falling back to stdlib json"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class UVError(Exception):
     """Base exception for UV command errors"""
     pass
@@ -24,6 +40,27 @@ class UVNotFoundError(UVError):
     """Exception raised when UV executable cannot be found"""
     pass
 
+# Seconds for which a package listing is reused; long enough to coalesce a
+# burst of queries into one subprocess, short enough to stay fresh
+_PACKAGE_LIST_TTL = 5.0
+
+# Platform-specific location of the python executable inside a venv,
+# resolved once at import time
+_PYTHON_SUBPATH = ("Scripts", "python.exe") if sys.platform == "win32" else ("bin", "python")
+
+def _venv_python(venv_path: str) -> str:
+    """Return the path to the python executable inside a virtual environment"""
+    return os.path.join(venv_path, *_PYTHON_SUBPATH)
+
+# Requirement line: package name (optionally with extras) followed by any
+# version constraint
+_REQUIREMENT_RE = re.compile(r"([A-Za-z0-9][A-Za-z0-9._-]*(?:\[[^\]]*\])?)\s*(.*)")
+
+@functools.lru_cache(maxsize=1)
+def _uv_bin() -> str:
+    """Locate the uv executable once and reuse it for the process lifetime"""
+    return uv.find_uv_bin()
+
 def spec(package_name: str, version: Optional[str] = None) -> Tuple[str, Optional[str]]:
     if version:
         return f"{package_name}=={version}"
@@ -41,6 +78,11 @@ class UVWrapper:
             venv_path: Path to virtual environment. If None, will look for .venv or venv
         """
         self.venv_path = self._resolve_venv_path(venv_path)
+        self._env = self._build_env()
+        self._pip_list_cache: Dict[bool, Tuple[float, bytes]] = {}
+        self._pip_list_parsed: Dict[bool, List[Dict[str, Any]]] = {}
+        self._package_index: Optional[Dict[str, Optional[str]]] = None
+        self._requirements_cache: Dict[str, Tuple[float, List[Dict[str, str]]]] = {}
         print(f"Using virtual environment: {self.venv_path}")
         
     def _resolve_venv_path(self, venv_path: Optional[str]) -> Optional[str]:
@@ -66,47 +108,450 @@ class UVWrapper:
                 return str(path.absolute())
                 
         return None
-        
-    def run_uv_command(self, command: List[str]) -> Union[str, Dict[str, Any]]:
+
+    def _build_env(self) -> Dict[str, str]:
+        """
+        Build the environment for uv subprocesses once
+
+        uv has no long-running daemon mode, so every command still pays a
+        process spawn; the per-call setup (environment copy and PATH
+        splicing for the virtual environment) is hoisted here instead.
+
+        Returns:
+            Environment dict to pass to subprocess calls
+        """
+        env = os.environ.copy()
+
+        if self.venv_path:
+            env["VIRTUAL_ENV"] = self.venv_path
+            env["PATH"] = os.path.join(self.venv_path, "bin") + os.pathsep + env["PATH"]
+
+        return env
+
+    def run_uv_command(self, command: List[str], raw_json: bool = False) -> Union[str, bytes]:
         """
         Run a uv command and return the output
-        
+
         Args:
             command: List of command arguments (without 'uv' prefix)
-        
+            raw_json: Return stdout as raw JSON bytes without parsing; the
+                caller vouches that the command produces JSON
+
         Returns:
-            Command output as string or parsed JSON
-        
+            Command output as string or raw bytes
+
         Raises:
             UVNotFoundError: If uv executable cannot be found
             UVCommandError: If command execution fails
         """
         try:
-            uv_bin = uv.find_uv_bin()
-            full_command = [uv_bin]
+            full_command = [_uv_bin()]
             
             full_command.extend(command)
-            
-            env = os.environ.copy()
-            
-            # If we have a venv path, add it to the command
-            if self.venv_path:
-                env["VIRTUAL_ENV"] = self.venv_path
-                env["PATH"] = os.path.join(self.venv_path, "bin") + os.pathsep + env["PATH"]
-                
+
+            # close_fds=False lets CPython spawn via posix_spawn instead of
+            # fork+exec, skipping page-table duplication of this process.
+            # Python file descriptors are non-inheritable by default, so
+            # nothing leaks to the child.
             result = subprocess.run(
                 full_command,
                 capture_output=True,
-                text=True,
                 check=False,  # We'll handle errors ourselves
-                env=env
+                close_fds=False,
+                env=self._env
             )
-            
+
             if result.returncode != 0:
-                cmd_str = ' '.join(shlex.quote(arg) for arg in full_command)
-                raise UVCommandError(cmd_str, result.returncode, result.stderr)
-            
-            return result.stdout
-        
+                cmd_str = shlex.join(full_command)
+                raise UVCommandError(cmd_str, result.returncode, result.stderr.decode(errors="replace"))
+
+            if raw_json:
+                return result.stdout
+
+            return result.stdout.decode()
+
         except FileNotFoundError:
-            raise UVNotFoundError(f"UV executable not found or could not be executed")
\ No newline at end of file
+            # Drop the cached path in case a stale location is what failed
+            _uv_bin.cache_clear()
+            raise UVNotFoundError(f"UV executable not found or could not be executed")
+
+    def _invalidate_package_cache(self) -> None:
+        """Drop cached package data after the environment changes"""
+        self._pip_list_cache.clear()
+        self._pip_list_parsed.clear()
+        self._package_index = None
+        self.get_package_info.cache_clear()
+
+    def _pip_list_bytes(self, outdated: bool = False) -> bytes:
+        """
+        Run 'uv pip list' for the active environment with TTL caching
+
+        The cache holds uv's raw JSON bytes so resource endpoints can pass
+        them through without a parse/re-encode round-trip; the installed and
+        outdated listings cache independently, so a client browsing both
+        views back-to-back pays one subprocess per view rather than one per
+        fetch.
+
+        Args:
+            outdated: Restrict the listing to outdated packages
+
+        Returns:
+            Raw JSON bytes from uv
+
+        Raises:
+            UVCommandError: If the pip list command fails
+        """
+        cached = self._pip_list_cache.get(outdated)
+        if cached is not None and time.monotonic() - cached[0] < _PACKAGE_LIST_TTL:
+            return cached[1]
+
+        command = ["pip", "list", "--format=json"]
+        if outdated:
+            command.append("--outdated")
+
+        raw = self.run_uv_command(command, raw_json=True)
+        self._pip_list_cache[outdated] = (time.monotonic(), raw)
+        self._pip_list_parsed.pop(outdated, None)
+        if not outdated:
+            self._package_index = None
+        return raw
+
+    def _pip_list(self, outdated: bool = False) -> List[Dict[str, Any]]:
+        """
+        Parsed view of the cached 'uv pip list' output
+
+        Args:
+            outdated: Restrict the listing to outdated packages
+
+        Returns:
+            List of package dicts
+
+        Raises:
+            UVCommandError: If the pip list command fails
+        """
+        raw = self._pip_list_bytes(outdated)
+        packages = self._pip_list_parsed.get(outdated)
+        if packages is None:
+            try:
+                packages = _loads(raw)
+            except ValueError:
+                # A non-JSON payload from --format=json indicates a bug;
+                # raising keeps callers free of isinstance checks
+                command = "uv pip list --format=json" + (" --outdated" if outdated else "")
+                raise UVCommandError(command, 0, "Expected JSON output")
+            self._pip_list_parsed[outdated] = packages
+        return packages
+
+    def list_installed_packages(self) -> List[Dict[str, Any]]:
+        """
+        List all packages installed in the active environment
+
+        Results are cached for a few seconds so repeated queries in a batch
+        share one subprocess; any install or uninstall invalidates the cache.
+
+        Returns:
+            List of package dicts with 'name' and 'version' keys
+
+        Raises:
+            UVCommandError: If the pip list command fails
+        """
+        return self._pip_list()
+
+    def list_installed_packages_json(self) -> str:
+        """
+        Installed-package listing as a JSON string, straight from uv
+
+        Returns:
+            JSON array text suitable for application/json passthrough
+        """
+        return self._pip_list_bytes().decode()
+
+    def get_outdated_packages_json(self) -> str:
+        """
+        Outdated-package listing as a JSON string, straight from uv
+
+        Returns:
+            JSON array text suitable for application/json passthrough
+        """
+        return self._pip_list_bytes(outdated=True).decode()
+
+    def get_outdated_packages(self) -> List[Dict[str, Any]]:
+        """
+        List installed packages with newer versions available
+
+        Returns:
+            List of package dicts including 'latest_version'
+
+        Raises:
+            UVCommandError: If the pip list command fails
+        """
+        return self._pip_list(outdated=True)
+
+    def check_package_installed(self, package_name: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check whether a package is installed in the active environment
+
+        Args:
+            package_name: Name of the package to look for
+
+        Returns:
+            Tuple of (installed, version); version is None if not installed
+        """
+        if self.venv_path is None:
+            # No separate venv means we are inspecting our own environment,
+            # so an in-process metadata lookup replaces the uv subprocess
+            try:
+                return True, importlib.metadata.version(package_name)
+            except importlib.metadata.PackageNotFoundError:
+                return False, None
+
+        packages = self.list_installed_packages()
+        if self._package_index is None:
+            # Lowercase once per listing so each lookup is a hash probe
+            # instead of a scan with per-element lowering
+            self._package_index = {pkg["name"].lower(): pkg.get("version") for pkg in packages}
+
+        name = package_name.lower()
+        if name in self._package_index:
+            return True, self._package_index[name]
+        return False, None
+
+    @functools.lru_cache(maxsize=256)
+    def get_package_info(self, package_name: str) -> Dict[str, Any]:
+        """
+        Get detailed information about an installed package
+
+        Results are cached per package name; installs and uninstalls clear
+        the cache.
+
+        Args:
+            package_name: Name of the package to inspect
+
+        Returns:
+            Dict of package metadata parsed from 'uv pip show'
+
+        Raises:
+            UVCommandError: If the pip show command fails
+        """
+        output = self.run_uv_command(["pip", "show", package_name])
+
+        info: Dict[str, Any] = {}
+        for line in output.splitlines():
+            key, sep, value = line.partition(":")
+            if sep:
+                info[key.strip().lower()] = value.strip()
+
+        for list_key in ("requires", "required-by"):
+            if info.get(list_key):
+                info[list_key] = [name.strip() for name in info[list_key].split(",")]
+
+        return info
+
+    def parse_requirements(self, file_path: str) -> List[Dict[str, str]]:
+        """
+        Parse a requirements file into name/constraint entries
+
+        Results are cached keyed on the file's mtime, so repeated reads of
+        an unchanged file skip the parse.
+
+        Args:
+            file_path: Path to the requirements file
+
+        Returns:
+            List of dicts with 'name' and 'constraint' keys
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        mtime = os.path.getmtime(file_path)
+        cached = self._requirements_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # Staged generators keep the strip/filter/match pipeline lazy; only
+        # the final comprehension materializes a list
+        lines = (raw_line.split("#", 1)[0].strip()
+                 for raw_line in pathlib.Path(file_path).read_text().splitlines())
+        matches = (_REQUIREMENT_RE.match(line)
+                   for line in lines if line and not line.startswith("-"))
+        requirements = [
+            {"name": name, "constraint": constraint.strip()}
+            for name, constraint in (match.groups() for match in matches if match)
+        ]
+
+        self._requirements_cache[file_path] = (mtime, requirements)
+        return requirements
+
+    def install_package(self, package_name: str, version: Optional[str] = None) -> str:
+        """
+        Install a package into the active environment
+
+        Args:
+            package_name: Name of the package to install
+            version: Optional exact version to pin
+
+        Returns:
+            Command output
+        """
+        output = self.run_uv_command(["pip", "install", spec(package_name, version)])
+        self._invalidate_package_cache()
+        return output
+
+    def uninstall_package(self, package_name: str) -> str:
+        """
+        Uninstall a package from the active environment
+
+        Args:
+            package_name: Name of the package to remove
+
+        Returns:
+            Command output
+        """
+        output = self.run_uv_command(["pip", "uninstall", package_name])
+        self._invalidate_package_cache()
+        return output
+
+    def add_dependency(self, package_name: str, version: Optional[str] = None) -> str:
+        """
+        Add a dependency to the project
+
+        Args:
+            package_name: Name of the package to add
+            version: Optional exact version to pin
+
+        Returns:
+            Command output
+        """
+        output = self.run_uv_command(["add", spec(package_name, version)])
+        self._invalidate_package_cache()
+        return output
+
+    def remove_dependency(self, package_name: str) -> str:
+        """
+        Remove a dependency from the project
+
+        Args:
+            package_name: Name of the package to remove
+
+        Returns:
+            Command output
+        """
+        output = self.run_uv_command(["remove", package_name])
+        self._invalidate_package_cache()
+        return output
+
+    def _list_env_packages(self, env_path: str) -> List[Dict[str, Any]]:
+        """
+        List installed packages for an arbitrary virtual environment
+
+        Args:
+            env_path: Path to the virtual environment to inspect
+
+        Returns:
+            List of package dicts with 'name' and 'version' keys
+
+        Raises:
+            UVCommandError: If the pip list command fails
+        """
+        python_bin = _venv_python(env_path)
+        full_command = [_uv_bin(), "pip", "list", "--format=json", "--python", python_bin]
+
+        result = subprocess.run(
+            full_command,
+            capture_output=True,
+            check=False,
+            close_fds=False,  # keep the posix_spawn fast path
+        )
+
+        if result.returncode != 0:
+            cmd_str = shlex.join(full_command)
+            raise UVCommandError(cmd_str, result.returncode, result.stderr.decode(errors="replace"))
+
+        try:
+            return _loads(result.stdout)
+        except ValueError:
+            raise UVCommandError(shlex.join(full_command), result.returncode, "Expected JSON output")
+
+    def create_virtualenv(self, path: str, packages: Optional[List[str]] = None) -> str:
+        """
+        Create a new virtual environment, optionally installing packages
+
+        Args:
+            path: Path at which to create the virtual environment
+            packages: Optional list of package specs to install into it
+
+        Returns:
+            Confirmation message with the environment path
+
+        Raises:
+            UVCommandError: If environment creation or installation fails
+        """
+        venv_command = [_uv_bin(), "venv", path]
+
+        result = subprocess.run(
+            venv_command,
+            capture_output=True,
+            text=True,
+            check=False,
+            close_fds=False,  # keep the posix_spawn fast path
+        )
+
+        if result.returncode != 0:
+            cmd_str = shlex.join(venv_command)
+            raise UVCommandError(cmd_str, result.returncode, result.stderr)
+
+        if packages:
+            python_bin = _venv_python(path)
+            # One invocation for all packages lets uv resolve and download
+            # them in parallel instead of paying a process spawn per package
+            install_command = [_uv_bin(), "pip", "install", "--python", python_bin, *packages]
+
+            result = subprocess.run(
+                install_command,
+                capture_output=True,
+                text=True,
+                check=False,
+                close_fds=False,  # keep the posix_spawn fast path
+            )
+
+            if result.returncode != 0:
+                cmd_str = shlex.join(install_command)
+                raise UVCommandError(cmd_str, result.returncode, result.stderr)
+
+        return f"Created virtual environment at {path}"
+
+    def compare_environments(self, env1_path: str, env2_path: str) -> Dict[str, Any]:
+        """
+        Compare installed packages between two virtual environments
+
+        Args:
+            env1_path: Path to the first virtual environment
+            env2_path: Path to the second virtual environment
+
+        Returns:
+            Dict with packages only in each environment and version differences
+
+        Raises:
+            UVCommandError: If listing either environment fails
+        """
+        # The two listings are independent subprocesses; overlap their wallclock
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(self._list_env_packages, env1_path)
+            future2 = executor.submit(self._list_env_packages, env2_path)
+            packages1, packages2 = future1.result(), future2.result()
+
+        pkg_dict1 = {pkg["name"]: pkg["version"] for pkg in packages1}
+        pkg_dict2 = {pkg["name"]: pkg["version"] for pkg in packages2}
+
+        # Key views diff at C level rather than via Python-level scans
+        keys1, keys2 = pkg_dict1.keys(), pkg_dict2.keys()
+
+        return {
+            "only_in_env1": sorted(keys1 - keys2),
+            "only_in_env2": sorted(keys2 - keys1),
+            "version_differences": {
+                name: {"env1": pkg_dict1[name], "env2": pkg_dict2[name]}
+                for name in keys1 & keys2
+                if pkg_dict1[name] != pkg_dict2[name]
+            },
+        }
\ No newline at end of file